@@ -1,5 +1,10 @@
 #!/bin/sh
 
 
+# torchvision pulls in stock Pillow, so swap it for a Pillow-SIMD build.
+# Requires libjpeg-turbo headers (e.g. libjpeg-turbo8-dev) so JPEG coding uses SIMD as well.
+pip uninstall -y pillow
+CC="cc -mavx2" pip install --no-binary :all: pillow-simd==8.3.2.post1
+
 python download.py
 python generate.py
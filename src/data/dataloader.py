@@ -32,13 +32,42 @@ class CompareDataLoader(data.Dataset):
     def shuffle(self):
         self.__dataset.shuffle()
 
+    def loader(
+            self,
+            num_workers: int = 0,
+            persistent_workers: bool = False,
+            pin_memory: bool = False
+    ) -> data.DataLoader:
+        # Instance groups are drawn in the main process, so every epoch is reshuffled even with persistent workers.
+        sampler = data.BatchSampler(
+            data.RandomSampler(range(len(self.__dataset))),
+            batch_size=self.image_set_num,
+            drop_last=True
+        )
+
+        options = {}
+        if num_workers > 0:
+            options = dict(persistent_workers=persistent_workers, prefetch_factor=4)
+
+        return data.DataLoader(
+            self,
+            batch_size=None,
+            sampler=sampler,
+            num_workers=num_workers,
+            pin_memory=pin_memory,
+            **options
+        )
+
     def __len__(self):
         return len(self.__dataset) // self.image_set_num
 
-    def __getitem__(self, idx) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    def __getitem__(self, idx: int or List[int]) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        if isinstance(idx, int):
+            idx = range(idx * self.image_set_num, (idx + 1) * self.image_set_num)
+
         sets = []
-        for i in range(self.image_set_num):
-            set, _ = self.__dataset[idx * self.image_set_num + i]
+        for i in idx:
+            set, _ = self.__dataset[i]
             if len(set) > self.max_image_num:
                 set = list(sample(set, self.max_image_num))
             sets.append(set)
@@ -53,21 +82,7 @@ class CompareDataLoader(data.Dataset):
         keys = torch.cat(sets, dim=0)
         queries = keys
 
-        labels = []
-        for i in range(len(sets)):
-            current_labels = []
-            for j in range(len(sets)):
-                if i == j:
-                    current_labels.extend([1.0] * len(sets[j]))
-                else:
-                    current_labels.extend([0.0] * len(sets[j]))
-
-            current_labels = torch.tensor(current_labels)
-            current_labels = current_labels.repeat(len(sets[i]), 1)
-
-            labels.append(current_labels)
-
-        labels = torch.cat(labels, dim=0)
+        labels = torch.block_diag(*[torch.ones(len(set), len(set)) for set in sets])
 
         return keys, queries, labels
 
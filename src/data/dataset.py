@@ -1,6 +1,5 @@
 from abc import abstractmethod, ABCMeta
 from pathlib import Path
-from random import shuffle
 from typing import List, Tuple, Optional
 
 import numpy as np
@@ -43,6 +42,10 @@ class COCODataset(data.Dataset):
 
         self.__image_ids = load_annotated_ids(self.__coco)
 
+    @property
+    def image_ids(self) -> List[int]:
+        return self.__image_ids
+
     def __len__(self):
         return len(self.__image_ids)
 
@@ -55,11 +58,14 @@ class COCODataset(data.Dataset):
         return image, annotations
 
     def load_image(self, image_id) -> Image.Image:
-        image_info = self.__coco.loadImgs(image_id)[0]
-        path = self.data_path.joinpath(image_info['file_name'])
+        path = self.load_image_path(image_id)
         image = Image.open(path).convert('RGB')
         return image
 
+    def load_image_path(self, image_id) -> Path:
+        image_info = self.__coco.loadImgs(image_id)[0]
+        return self.data_path.joinpath(image_info['file_name'])
+
     def load_annotations(self, image_id) -> np.ndarray:
         # get ground truth annotations
         annotations_ids = self.__coco.getAnnIds(imgIds=image_id, iscrowd=False)
@@ -115,10 +121,10 @@ class LocalInstanceDataset(InstanceDataset):
         self.data_path = path.joinpath(dataset)
 
         data_size = get_data_size(self.data_path)
-        self.__image_ids = list(range(data_size))
+        self.__image_ids = np.arange(data_size)
 
     def shuffle(self):
-        shuffle(self.__image_ids)
+        self.__image_ids = np.random.permutation(self.__image_ids)
 
     def __len__(self):
         return len(self.__image_ids)
@@ -152,6 +158,7 @@ class CombinedInstanceDataset(InstanceDataset):
         self.__weights = weights
 
         self.__data = self.__load_data()
+        self.__order = np.arange(len(self.__data))
 
     def __load_data(self) -> List[Tuple[int, int]]:
         data = []
@@ -169,13 +176,13 @@ class CombinedInstanceDataset(InstanceDataset):
     def shuffle(self):
         for dataset in self.__datasets:
             dataset.shuffle()
-        shuffle(self.__data)
+        self.__order = np.random.permutation(len(self.__data))
 
     def __len__(self):
         return len(self.__data)
 
     def __getitem__(self, index) -> Tuple[List[Image.Image], Path]:
-        dataset_id, data_id = self.__data[index]
+        dataset_id, data_id = self.__data[self.__order[index]]
 
         dataset = self.__datasets[dataset_id]
         return dataset[data_id]
@@ -1,7 +1,12 @@
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from random import random, randint
+from typing import Tuple
 
+import numpy as np
 from PIL import Image
 from PIL import ImageFilter
 from tqdm import tqdm
@@ -10,6 +15,31 @@ from src.data.dataset import COCODataset, InstanceDataset
 from src.data.utils import get_data_size
 
 
+def generate_bounding_box_images(
+        path: Path,
+        format: str,
+        existed_data_size: int,
+        task: Tuple[Path, np.ndarray, int]
+) -> int:
+    image_path, boxes, offset = task
+
+    pixels = np.asarray(Image.open(image_path).convert('RGB'))
+    boxes = np.round(boxes).astype(np.int32)
+    for index, (x1, y1, x2, y2) in enumerate(boxes, offset):
+        if index < existed_data_size:
+            continue
+
+        # LocalInstanceDataset reads <index>/ and NoisedImageGenerator adds variants next to 0.jpg,
+        # so each instance keeps its own directory.
+        image_dir = path.joinpath(str(index))
+        image_dir.mkdir(exist_ok=True)
+
+        instance_image = Image.fromarray(pixels[y1:y2, x1:x2])
+        instance_image.save(image_dir.joinpath(f'0.{format}'))
+
+    return offset + len(boxes)
+
+
 class BoundingBoxImageGenerator:
     def __init__(
             self,
@@ -23,29 +53,54 @@ class BoundingBoxImageGenerator:
         self.__path = path.joinpath(dataset.dataset)
         self.__format = format
 
+        self.__data_size_path = self.__path.joinpath('.data_size')
+        self.__save_interval = 1000
+
     def generate(self, force: bool = False):
-        if os.path.exists(self.__path) and force:
-            os.remove(self.__path)
+        if force and self.__path.exists():
+            shutil.rmtree(self.__path)
 
         self.__path.mkdir(parents=True, exist_ok=True)
 
-        existed_data_size = get_data_size(self.__path)
-        current_data_index = 0
+        existed_data_size = self.__load_data_size()
 
-        print(f'Generate bounding box images from {self.__dataset.data_path} to {self.__path}')
-        for image, annotations in tqdm(self.__dataset):
-            boxes = annotations[:, :4]
-            for box in boxes:
-                current_data_index += 1
+        # Instance indices are fixed up front, so images can be cropped in any process.
+        tasks = []
+        offset = 0
+        for image_id in self.__dataset.image_ids:
+            boxes = self.__dataset.load_annotations(image_id)[:, :4]
+            if len(boxes) > 0 and offset + len(boxes) > existed_data_size:
+                tasks.append((self.__dataset.load_image_path(image_id), boxes, offset))
+            offset += len(boxes)
 
-                if current_data_index <= existed_data_size:
-                    continue
+        generate = partial(generate_bounding_box_images, self.__path, self.__format, existed_data_size)
 
-                image_dir = self.__path.joinpath(str(current_data_index - 1))
-                image_dir.mkdir(parents=True)
-
-                instance_image = image.crop(box)
-                instance_image.save(image_dir.joinpath(f'0.{self.__format}'))
+        print(f'Generate bounding box images from {self.__dataset.data_path} to {self.__path}')
+        data_size = existed_data_size
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(generate, tasks, chunksize=16)
+            for i, data_size in enumerate(tqdm(results, total=len(tasks)), 1):
+                if i % self.__save_interval == 0:
+                    self.__save_data_size(data_size)
+
+        self.__save_data_size(data_size)
+
+    def __load_data_size(self) -> int:
+        if self.__data_size_path.exists():
+            return int(self.__data_size_path.read_text())
+
+        # Output from before the size file existed was written in order, so counting it is safe once.
+        # Persist the count right away: parallel workers write out of order from here on.
+        data_size = get_data_size(self.__path)
+        self.__save_data_size(data_size)
+
+        return data_size
+
+    def __save_data_size(self, data_size: int) -> None:
+        # replace atomically so an interrupted write never leaves an empty size file
+        tmp_path = self.__data_size_path.with_name(f'{self.__data_size_path.name}.tmp')
+        tmp_path.write_text(str(data_size))
+        os.replace(tmp_path, self.__data_size_path)
 
 
 class NoisedImageGenerator:
@@ -0,0 +1,53 @@
+from typing import Iterator, Tuple
+
+import torch
+from torch.utils import data
+
+
+class DevicePrefetcher:
+    def __init__(
+            self,
+            data_loader: data.DataLoader,
+            device: torch.device
+    ):
+        self.__data_loader = data_loader
+        self.__device = device
+
+    def __len__(self):
+        return len(self.__data_loader)
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, ...]]:
+        if self.__device.type != 'cuda':
+            for batch in self.__data_loader:
+                yield self.__to_device(batch)
+            return
+
+        stream = torch.cuda.Stream(device=self.__device)
+        current_stream = torch.cuda.current_stream(self.__device)
+
+        batch = None
+        for next_batch in self.__data_loader:
+            # copy the next batch on a side stream while the current one is being consumed
+            with torch.cuda.stream(stream):
+                next_batch = self.__to_device(next_batch)
+
+            if batch is not None:
+                yield batch
+
+            current_stream.wait_stream(stream)
+            for tensor in next_batch:
+                tensor.record_stream(current_stream)
+
+            batch = next_batch
+
+        if batch is not None:
+            yield batch
+
+    def __to_device(self, batch: Tuple[torch.Tensor, ...]) -> Tuple[torch.Tensor, ...]:
+        return tuple(
+            tensor.to(
+                self.__device,
+                non_blocking=True,
+                memory_format=torch.channels_last if tensor.dim() == 4 else torch.preserve_format
+            ) for tensor in batch
+        )
@@ -21,6 +21,8 @@ class Comparator(nn.Module):
         x1_tokens: torch.Tensor = self.tokenizer(x1)
         x2_tokens: torch.Tensor = self.tokenizer(x2)
 
-        distance = self.cosine_distance(x1_tokens, x2_tokens)
+        # keep the distance in float32 under autocast so the output stays within [0, 1]
+        with torch.cuda.amp.autocast(enabled=False):
+            distance = self.cosine_distance(x1_tokens.float(), x2_tokens.float())
 
         return 1 - distance
@@ -200,7 +200,7 @@ class Tokenizer(nn.Module):
         x_out = self.compression(x_out)
 
         batch, channel, w, h = x_out.size()
-        x_out = x_out.view(batch * channel, -1)
+        x_out = x_out.reshape(batch * channel, -1)
 
         x_out = self.feature_compression(x_out)
 
@@ -58,8 +58,8 @@ class Lookahead(Optimizer):
                 param_state = self.state[p]
                 param_state['cached_params'] = param_state['cached_params'].to(self.device)
 
-    def zero_grad(self):
-        self.optimizer.zero_grad()
+    def zero_grad(self, set_to_none=False):
+        self.optimizer.zero_grad(set_to_none=set_to_none)
 
     def state_dict(self):
         return self.optimizer.state_dict()
@@ -96,11 +96,18 @@ class Lookahead(Optimizer):
         if self.step_counter >= self.k:
             self.step_counter = 0
             # Lookahead and cache the current optimizer parameters
-            for group in self.optimizer.param_groups:
-                for p in group['params']:
+            params = [p for group in self.optimizer.param_groups for p in group['params']]
+            fast_weights = [p.data for p in params]
+            slow_weights = [self.state[p]['cached_params'] for p in params]
+
+            torch._foreach_mul_(fast_weights, self.alpha)
+            torch._foreach_add_(fast_weights, slow_weights, alpha=1.0 - self.alpha)  # crucial line
+            torch._foreach_zero_(slow_weights)
+            torch._foreach_add_(slow_weights, fast_weights)
+
+            if self.pullback_momentum != "none":
+                for p in params:
                     param_state = self.state[p]
-                    p.data.mul_(self.alpha).add_(1.0 - self.alpha, param_state['cached_params'])  # crucial line
-                    param_state['cached_params'].copy_(p.data)
                     if self.pullback_momentum == "pullback":
                         internal_momentum = self.optimizer.state[p]["momentum_buffer"]
                         self.optimizer.state[p]["momentum_buffer"] = internal_momentum.mul_(self.alpha).add_(
@@ -43,7 +43,7 @@ class Tester:
             loss=float('inf')
         )
 
-    async def run(self) -> None:
+    def run(self) -> None:
         print(
             'epochs is {:3d}, train best loss is {:5.2f}.'.format(
                 self._checkpoint.epoch,
@@ -55,7 +55,7 @@ class Tester:
         self._in_memory_checkpoint.save()
         self._checkpoint.load(map_location=self._device)
 
-        loss, pre_time = await self.evaluate()
+        loss, pre_time = self.evaluate()
 
         self._in_memory_checkpoint.load(map_location=self._device)
 
@@ -68,7 +68,7 @@ class Tester:
             ),
         )
 
-    async def evaluate(self) -> Tuple[float, float]:
+    def evaluate(self) -> Tuple[float, float]:
         raise NotImplemented
 
 
@@ -93,7 +93,7 @@ class ComparatorTester(Tester):
         self.__criterion = nn.BCELoss()
         self.__criterion.to(self._device)
 
-    async def evaluate(self) -> Tuple[float, float]:
+    def evaluate(self) -> Tuple[float, float]:
         self._model.eval()
         self.__dataset.shuffle()
 
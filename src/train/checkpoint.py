@@ -4,6 +4,7 @@ from typing import Optional
 
 import torch
 from torch import nn
+from torch.cuda.amp import GradScaler
 from torch.optim import Optimizer
 
 
@@ -28,6 +29,16 @@ class Checkpoint(metaclass=ABCMeta):
     def optimizer(self, value: Optional[Optimizer]) -> None:
         pass
 
+    @property
+    @abstractmethod
+    def scaler(self) -> Optional[GradScaler]:
+        pass
+
+    @scaler.setter
+    @abstractmethod
+    def scaler(self, value: Optional[GradScaler]) -> None:
+        pass
+
     @property
     @abstractmethod
     def epoch(self) -> int:
@@ -64,12 +75,14 @@ class HardCheckpoint(Checkpoint):
             model: nn.Module,
             optimizer: Optional[Optimizer],
             epoch: int,
-            loss: float
+            loss: float,
+            scaler: Optional[GradScaler] = None
     ):
         self.__path = path
 
         self.__model = model
         self.__optimizer = optimizer
+        self.__scaler = scaler
         self.__epoch = epoch
         self.__loss = loss
 
@@ -89,6 +102,14 @@ class HardCheckpoint(Checkpoint):
     def optimizer(self, value: Optional[Optimizer]) -> None:
         self.__optimizer = value
 
+    @property
+    def scaler(self) -> Optional[GradScaler]:
+        return self.__scaler
+
+    @scaler.setter
+    def scaler(self, value: Optional[GradScaler]) -> None:
+        self.__scaler = value
+
     @property
     def epoch(self) -> int:
         return self.__epoch
@@ -112,6 +133,7 @@ class HardCheckpoint(Checkpoint):
                 'epoch': self.epoch,
                 'model_state_dict': self.__model.state_dict(),
                 'optimizer_state_dict': self.__optimizer.state_dict() if self.__optimizer is not None else None,
+                'scaler_state_dict': self.__scaler.state_dict() if self.__scaler is not None else None,
             },
             self.__path
         )
@@ -125,12 +147,16 @@ class HardCheckpoint(Checkpoint):
 
         model_state_dict = checkpoint['model_state_dict']
         optimizer_state_dict = checkpoint['optimizer_state_dict']
+        scaler_state_dict = checkpoint.get('scaler_state_dict')
         epoch = checkpoint['epoch']
         loss = checkpoint['loss']
 
         self.__model.load_state_dict(model_state_dict)
         if self.__optimizer is not None and optimizer_state_dict is not None:
             self.__optimizer.load_state_dict(optimizer_state_dict)
+        # a disabled scaler saves an empty state dict, which an enabled one refuses to load
+        if self.__scaler is not None and scaler_state_dict:
+            self.__scaler.load_state_dict(scaler_state_dict)
         self.__epoch = epoch
         self.__loss = loss
 
@@ -143,15 +169,18 @@ class SoftCheckpoint(Checkpoint):
             model: nn.Module,
             optimizer: Optional[Optimizer],
             epoch: int,
-            loss: float
+            loss: float,
+            scaler: Optional[GradScaler] = None
     ):
         self.__model = model
         self.__optimizer = optimizer
+        self.__scaler = scaler
         self.__epoch = epoch
         self.__loss = loss
 
         self.__cached_model_state_dict = None
         self.__cached_optimizer_state_dict = None
+        self.__cached_scaler_state_dict = None
         self.__cached_epoch = None
         self.__cached_loss = None
 
@@ -171,6 +200,14 @@ class SoftCheckpoint(Checkpoint):
     def optimizer(self, value: Optional[Optimizer]) -> None:
         self.__optimizer = value
 
+    @property
+    def scaler(self) -> Optional[GradScaler]:
+        return self.__scaler
+
+    @scaler.setter
+    def scaler(self, value: Optional[GradScaler]) -> None:
+        self.__scaler = value
+
     @property
     def epoch(self) -> int:
         return self.__epoch
@@ -191,6 +228,8 @@ class SoftCheckpoint(Checkpoint):
         self.__cached_model_state_dict = self.__model.state_dict()
         if self.__optimizer is not None:
             self.__cached_optimizer_state_dict = self.__optimizer.state_dict()
+        if self.__scaler is not None:
+            self.__cached_scaler_state_dict = self.__scaler.state_dict()
         self.__cached_epoch = self.epoch
         self.__cached_loss = self.loss
 
@@ -205,6 +244,10 @@ class SoftCheckpoint(Checkpoint):
             result = True
             if self.__optimizer is not None:
                 self.__optimizer.load_state_dict(self.__cached_optimizer_state_dict)
+        if self.__cached_scaler_state_dict is not None:
+            result = True
+            if self.__scaler is not None and self.__cached_scaler_state_dict:
+                self.__scaler.load_state_dict(self.__cached_scaler_state_dict)
         if self.__cached_epoch is not None:
             result = True
             self.__epoch = self.__cached_epoch
@@ -214,6 +257,7 @@ class SoftCheckpoint(Checkpoint):
 
         self.__cached_model_state_dict = None
         self.__cached_optimizer_state_dict = None
+        self.__cached_scaler_state_dict = None
         self.__cached_epoch = None
         self.__cached_loss = None
 
@@ -9,6 +9,7 @@ from torch.optim import Optimizer
 from tqdm import tqdm
 
 from src.data.dataloader import CompareDataLoader
+from src.data.prefetcher import DevicePrefetcher
 from src.model.comparator import Comparator
 from src.optimiser.lookahead import Lookahead
 from src.optimiser.radam import RAdam
@@ -34,14 +35,23 @@ class Trainer:
 
         self._device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 
-        self._model.to(self._device)
+        self._model.to(self._device, memory_format=torch.channels_last)
+
+        self._scaler = torch.cuda.amp.GradScaler(enabled=self._device.type == 'cuda')
+
+        # Batch sizes vary with the number of images per set, so shapes are traced dynamically.
+        # Checkpoints keep the eager module so state dict keys stay unprefixed.
+        self._compiled_model = None
+        if hasattr(torch, 'compile'):
+            self._compiled_model = torch.compile(model, dynamic=True)
 
         self._best_checkpoint = HardCheckpoint(
             path=best_checkpoint_path,
             model=model,
             optimizer=optimizer,
             epoch=0,
-            loss=float('inf')
+            loss=float('inf'),
+            scaler=self._scaler
         )
 
         self._last_checkpoint = HardCheckpoint(
@@ -49,19 +59,21 @@ class Trainer:
             model=model,
             optimizer=optimizer,
             epoch=0,
-            loss=float('inf')
+            loss=float('inf'),
+            scaler=self._scaler
         )
 
         self._in_memory_checkpoint = SoftCheckpoint(
             model=model,
             optimizer=optimizer,
             epoch=0,
-            loss=float('inf')
+            loss=float('inf'),
+            scaler=self._scaler
         )
 
-    async def run(self, epochs: int) -> None:
+    def run(self, epochs: int) -> None:
         self.load()
-        await self.sync_best_checkpoint()
+        self.sync_best_checkpoint()
 
         print(
             'Training start. Final epochs is {:3d}, pre best loss is {:5.2f}.'.format(
@@ -78,8 +90,8 @@ class Trainer:
 
             epoch_start_time = time()
 
-            self._last_checkpoint.loss = await self.train()
-            self._last_checkpoint.loss = await self.evaluate()
+            self._last_checkpoint.loss = self.train()
+            self._last_checkpoint.loss = self.evaluate()
 
             epoch_end_time = time()
 
@@ -107,6 +119,17 @@ class Trainer:
             ),
         )
 
+    def forward(self, *inputs):
+        if self._compiled_model is not None:
+            # torch.compile is lazy, so unsupported backends only fail on a forward call.
+            try:
+                return self._compiled_model(*inputs)
+            except torch._dynamo.exc.BackendCompilerFailed as e:
+                print(f'Compilation failed, falling back to eager mode: {e}', flush=True)
+                self._compiled_model = None
+
+        return self._model(*inputs)
+
     def load(self):
         self._in_memory_checkpoint.save()
         self._best_checkpoint.load(map_location=self._device)
@@ -123,21 +146,21 @@ class Trainer:
 
             self._best_checkpoint.save()
 
-    async def sync_best_checkpoint(self):
+    def sync_best_checkpoint(self):
         self._in_memory_checkpoint.save()
 
         loaded = self._best_checkpoint.load(map_location=self._device)
         if loaded:
-            self._best_checkpoint.loss = await self.evaluate()
+            self._best_checkpoint.loss = self.evaluate()
 
         self._in_memory_checkpoint.load(map_location=self._device)
 
     @abc.abstractmethod
-    async def train(self) -> float:
+    def train(self) -> float:
         raise NotImplemented
 
     @abc.abstractmethod
-    async def evaluate(self) -> float:
+    def evaluate(self) -> float:
         raise NotImplemented
 
 
@@ -150,7 +173,9 @@ class ComparatorTrainer(Trainer):
             val_dataset: CompareDataLoader,
             lr: float,
             k: int,
-            alpha: float
+            alpha: float,
+            num_workers: int = 0,
+            persistent_workers: bool = False
     ):
         optimizer = RAdam(model.parameters(), lr=lr)
         optimizer = Lookahead(optimizer, k=k, alpha=alpha)
@@ -161,61 +186,78 @@ class ComparatorTrainer(Trainer):
             optimizer
         )
 
-        self.__train_dataset = train_dataset
-        self.__val_dataset = val_dataset
+        pin_memory = self._device.type == 'cuda'
+        self.__train_data_loader = DevicePrefetcher(
+            train_dataset.loader(
+                num_workers=num_workers,
+                persistent_workers=persistent_workers,
+                pin_memory=pin_memory
+            ),
+            self._device
+        )
+        self.__val_data_loader = DevicePrefetcher(
+            val_dataset.loader(
+                num_workers=num_workers,
+                persistent_workers=persistent_workers,
+                pin_memory=pin_memory
+            ),
+            self._device
+        )
 
         self.__criterion = nn.BCELoss()
         self.__criterion.to(self._device)
 
-    async def train(self) -> float:
-        self._model.train()
-
-        self.__train_dataset.shuffle()
+        self.__mixed_precision = self._scaler.is_enabled()
 
-        total_loss = 0.0
+    def train(self) -> float:
+        self._model.train()
 
-        data = tqdm(self.__train_dataset)
-        for i, (keys, queries, labels) in enumerate(data):
-            keys = keys.to(self._device)
-            queries = queries.to(self._device)
-            labels = labels.to(self._device)
+        total_loss = torch.zeros((), device=self._device)
 
-            self._optimizer.zero_grad()
+        progress = tqdm(self.__train_data_loader)
+        log_interval = max(1, len(progress) // 100)
+        steps_since_log = 0
+        for i, (keys, queries, labels) in enumerate(progress):
+            self._optimizer.zero_grad(set_to_none=True)
 
-            result = self._model(keys, queries)
+            with torch.cuda.amp.autocast(enabled=self.__mixed_precision):
+                result = self.forward(keys, queries)
 
+            # BCELoss is not autocast safe, so it runs outside the autocast region.
             loss = self.__criterion(result, labels)
-            loss.backward()
+            self._scaler.scale(loss).backward()
 
-            total_loss += loss.item()
+            total_loss += loss.detach()
 
-            self._optimizer.step()
+            self._scaler.step(self._optimizer)
+            self._scaler.update()
 
-            cur_loss = total_loss / (i + 1)
-            data.set_description('{:3d} epoch, {:5.2f} loss, {:8.2f} ppl'.format(
+            steps_since_log += 1
+            if steps_since_log < log_interval:
+                continue
+            steps_since_log = 0
+
+            cur_loss = total_loss.item() / (i + 1)
+            # Redrawing is left to tqdm's throttled refresh on the next update.
+            progress.set_description('{:3d} epoch, {:5.2f} loss, {:8.2f} ppl'.format(
                 self._last_checkpoint.epoch,
                 cur_loss,
-                math.exp(cur_loss)
-            ))
+                math.exp(min(cur_loss, 20))
+            ), refresh=False)
 
-        return total_loss / len(data)
+        return total_loss.item() / len(progress)
 
-    async def evaluate(self) -> float:
+    def evaluate(self) -> float:
         self._model.eval()
 
-        self.__val_dataset.shuffle()
-
-        total_loss = 0.0
-
-        with torch.no_grad():
-            for keys, queries, labels in tqdm(self.__val_dataset):
-                keys = keys.to(self._device)
-                queries = queries.to(self._device)
-                labels = labels.to(self._device)
+        with torch.inference_mode():
+            total_loss = torch.zeros((), device=self._device)
 
-                result = self._model(keys, queries)
+            for keys, queries, labels in tqdm(self.__val_data_loader):
+                with torch.cuda.amp.autocast(enabled=self.__mixed_precision):
+                    result = self.forward(keys, queries)
 
                 loss = self.__criterion(result, labels)
-                total_loss += loss.item()
+                total_loss += loss
 
-        return total_loss / len(self.__val_dataset)
+        return total_loss.item() / len(self.__val_data_loader)
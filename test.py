@@ -1,5 +1,4 @@
 import argparse
-import asyncio
 import os
 from pathlib import Path
 
@@ -18,7 +17,6 @@ if __name__ == '__main__':
     data_path = root_parent_path.joinpath('data')
     checkpoints_path = root_path.joinpath('checkpoints')
 
-    coco_data_path = data_path.joinpath('coco')
     instances_date_path = data_path.joinpath('instances')
 
     parser = argparse.ArgumentParser()
@@ -65,6 +63,5 @@ if __name__ == '__main__':
         epochs=args.epochs
     )
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(trainer.run())
+    trainer.run()
 
@@ -1,5 +1,4 @@
 import argparse
-import asyncio
 import os
 from pathlib import Path
 from time import time
@@ -19,7 +18,6 @@ if __name__ == '__main__':
     data_path = root_parent_path.joinpath('data')
     checkpoints_path = root_path.joinpath('checkpoints')
 
-    coco_data_path = data_path.joinpath('coco')
     instances_date_path = data_path.joinpath('instances')
 
     parser = argparse.ArgumentParser()
@@ -42,6 +40,9 @@ if __name__ == '__main__':
     parser.add_argument('--res_block_deep', type=int, default=2)
     parser.add_argument('--dropout_prob', type=float, default=0.4)
 
+    parser.add_argument('--num_workers', type=int, default=4)
+    parser.add_argument('--persistent_workers', action=argparse.BooleanOptionalAction, default=True)
+
     args = parser.parse_args()
 
     train_dataset = LocalInstanceDataset(
@@ -81,9 +82,10 @@ if __name__ == '__main__':
         val_dataset=val_dataset,
         lr=args.lr,
         k=args.k,
-        alpha=args.alpha
+        alpha=args.alpha,
+        num_workers=args.num_workers,
+        persistent_workers=args.persistent_workers
     )
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(trainer.run(epochs=args.epochs))
+    trainer.run(epochs=args.epochs)
 